@@ -5,8 +5,12 @@ import curses.ascii
 import curses.textpad
 import logging
 import os
+import shutil
 import subprocess
+import sys
 import tempfile
+from dataclasses import replace
+from functools import partial
 from importlib import import_module
 from math import inf
 from pathlib import Path
@@ -25,6 +29,7 @@ from bebop.help import get_help
 from bebop.history import History
 from bebop.identity import load_identities
 from bebop.links import Links
+from bebop.lru import LRUCache
 from bebop.metalines import LineType, RENDER_MODES
 from bebop.mime import MimeType
 from bebop.mouse import ButtonState
@@ -42,6 +47,40 @@ from bebop.preferences import load_capsule_prefs, save_capsule_prefs
 from bebop.welcome import WELCOME_PAGE
 
 
+#: Vertical/horizontal scroll units for each scroll key, coalesced in
+#: `Browser.handle_scroll_input` and scaled by the configured scroll step.
+SCROLL_UNITS = {
+    ord("j"): (1, 0),
+    curses.KEY_DOWN: (1, 0),
+    ord("k"): (-1, 0),
+    curses.KEY_UP: (-1, 0),
+    ord("h"): (0, -1),
+    curses.KEY_LEFT: (0, -1),
+    ord("l"): (0, 1),
+    curses.KEY_RIGHT: (0, 1),
+}
+
+#: Same as SCROLL_UNITS for keys scrolling by whole pages; units are scaled
+#: by the page dimensions instead of the scroll step.
+PAGE_SCROLL_UNITS = {
+    ord("J"): (1, 0),
+    curses.KEY_NPAGE: (1, 0),
+    ord("K"): (-1, 0),
+    curses.KEY_PPAGE: (-1, 0),
+    ord("H"): (0, -1),
+    ord("L"): (0, 1),
+}
+
+#: Key codes still compared to in `handle_inputs` after keymap dispatch;
+#: the curses ones are module-level to avoid attribute chains per keystroke.
+KEY_G = ord("g")
+KEY_ZERO = ord("0")
+KEY_NINE = ord("9")
+KEY_MOUSE = curses.KEY_MOUSE
+KEY_RESIZE = curses.KEY_RESIZE
+KEY_ESC = curses.ascii.ESC
+
+
 class Browser:
     """Manage the events, inputs and rendering.
 
@@ -54,10 +93,10 @@ class Browser:
     - status_line: curses window used to report current status.
     - command_line: a CommandLine object for the user to interact with.
     - running: the browser will continue running while this is true.
-    - status_data: 3-uple of status text, color pair and attributes of the
-        status line, used to reset status after an error.
+    - status_data: 2-uple of status text and combined curses attributes of
+        the status line, used to reset status after an error.
     - history: an History object.
-    - cache: a dict containing cached pages.
+    - cache: an LRUCache of pages, bounded by the cache_limit config value.
     - special_pages: a dict containing page names used with "bebop" scheme;
         values are dicts as well: the "open" key maps to a callable to use when
         the page is accessed, and the optional "source" key maps to callable
@@ -76,27 +115,68 @@ class Browser:
         self.stash = cert_stash
         self.screen = None
         self.dim = (0, 0)
+        self.update_dimensions()
         self.page_pad = None
         self.status_line = None
         self.command_line = None
         self.running = True
-        self.status_data = ("", 0, 0)
+        self.status_data = ("", 0)
+        self._last_status_render = None
+        self.color_pairs = {}
+        self._normal_status_attr = 0
+        self._error_status_attr = 0
         self.history = History(self.config["history_limit"])
-        self.cache = {}
+        self.cache = LRUCache(self.config["cache_limit"])
+        # Config values read on hot paths, cached as attributes; the config
+        # is never modified during a session.
+        self._scroll_step = self.config["scroll_step"]
+        self._source_editor = self.config["source_editor"]
+        self._external_commands = self.config["external_commands"]
+        self._external_command_default = self.config["external_command_default"]
         self.special_pages = self.setup_special_pages()
         self.last_download: Optional[Tuple[Optional[MimeType], Path]] = None
         self.identities = {}
         self.search_res_lines = []
+        self._internal_page_cache = LRUCache(8)
+        self._page_info = None
+        self._resolved_executables = {}
+        self._use_posix_spawn = hasattr(os, "posix_spawn")  # Python 3.8+.
+        self._scheme_plugins = {}
         self.plugins = []
         self._current_url = ""
-
-    @property
-    def h(self):
-        return self.dim[0]
-
-    @property
-    def w(self):
-        return self.dim[1]
+        self._current_parts = {}
+        self._parent_url = None
+        self._root_url = None
+        self.keymap, self.alt_keymap = self.setup_keymaps()
+        self.scheme_handlers = {
+            "gemini": self.open_gemini_scheme_url,
+            "http": self.open_web_scheme_url,
+            "https": self.open_web_scheme_url,
+            "file": self.open_file_scheme_url,
+            "bebop": self.open_bebop_scheme_url,
+        }
+        # The scheme backends import the browser module, so they can only be
+        # imported at runtime; doing it once here instead of on each
+        # navigation keeps the import machinery out of the open_url path.
+        from bebop.browser.file import open_file
+        from bebop.browser.gemini import open_gemini_url
+        from bebop.browser.web import open_web_url
+        self._open_gemini_url = open_gemini_url
+        self._open_web_url = open_web_url
+        self._open_file = open_file
+
+    def update_dimensions(self):
+        """Recompute geometry attributes; call after `dim` changed.
+
+        These values are read on every refresh and scroll, so they are plain
+        attributes refreshed only when the screen dimensions change, instead of
+        properties rebuilding tuples on each access.
+        """
+        self.h, self.w = self.dim
+        self.page_pad_size = (self.h - 3, self.w - 1)
+        self.status_line_pos = (self.h - 2, 0)
+        self.command_line_pos = (self.h - 1, 0)
+        self.line_dim = (1, self.w)
 
     @property
     def current_url(self) -> str:
@@ -105,14 +185,22 @@ class Browser:
 
     @current_url.setter
     def current_url(self, url: str):
-        """Set the current URL and show it in the status line."""
+        """Set the current URL and show it in the status line.
+
+        The URL parts are parsed once here, so that the scheme and parts
+        properties do not re-parse the URL on every read.
+        """
         self._current_url = url
+        self._current_parts = parse_url(url) if url else {}
+        # Parent and root URLs are derived lazily in the go_to_* methods.
+        self._parent_url = None
+        self._root_url = None
         self.set_status(url)
 
     @property
     def current_scheme(self):
         """Return the scheme of the current URL."""
-        return parse_url(self._current_url)["scheme"] or ""
+        return self._current_parts.get("scheme") or ""
 
     @property
     def current_page(self) -> Optional[Page]:
@@ -130,9 +218,49 @@ class Browser:
             },
         }
 
+    def setup_keymaps(self):
+        """Return the dispatch dicts for regular and ALT-prefixed keys.
+
+        Built once so that `handle_inputs` only has to do a dict lookup per
+        keystroke instead of comparing the key against each binding in turn.
+        """
+        keymap = {
+            ord("?"): self.open_help,
+            ord(":"): partial(self.quick_command, ""),
+            ord("r"): self.reload_page,
+            ord("^"): partial(self.scroll_page_horizontally, -inf),
+            ord("G"): partial(self.scroll_page_vertically, inf),
+            ord("o"): partial(self.quick_command, "open"),
+            # The current URL has to be read at key press time, so this one
+            # stays a lambda.
+            ord("O"): lambda: self.quick_command(f"open {self.current_url}"),
+            ord("p"): self.go_back,
+            ord("u"): self.go_to_parent_page,
+            ord("U"): self.go_to_root_page,
+            ord("b"): self.open_bookmarks,
+            ord("B"): self.add_bookmark,
+            ord("e"): self.edit_page,
+            ord("y"): self.open_history,
+            ord("m"): self.toggle_render_mode,
+            ord("/"): self.search_in_page,
+            ord("n"): partial(self.move_to_search_result, Browser.SEARCH_NEXT),
+            ord("N"): partial(
+                self.move_to_search_result, Browser.SEARCH_PREVIOUS),
+            ord("i"): self.show_page_info,
+        }
+        alt_keymap = {
+            ord("h"): partial(self.scroll_page_horizontally, -1),
+            ord("j"): partial(self.scroll_page_vertically, 1),
+            ord("k"): partial(self.scroll_page_vertically, -1),
+            ord("l"): partial(self.scroll_page_horizontally, 1),
+            ord("o"): self.open_last_download,
+        }
+        return keymap, alt_keymap
+
     def run(self, *args, **kwargs):
         """Use curses' wrapper around _run."""
-        os.environ.setdefault("ESCDELAY", "25")
+        if not hasattr(curses, "set_escdelay"):  # Python < 3.9.
+            os.environ.setdefault("ESCDELAY", "25")
         logging.info("Cursing…")
         curses.wrapper(self._run, *args, **kwargs)
 
@@ -140,16 +268,29 @@ class Browser:
         """Start displaying content and handling events."""
         # Setup Curses.
         self.screen = stdscr
+        if hasattr(curses, "set_escdelay"):
+            curses.set_escdelay(25)
         self.screen.clear()
         self.screen.refresh()
         mousemask = curses.mousemask(curses.ALL_MOUSE_EVENTS)
         if mousemask == 0:
             logging.error("Could not enable mouse support.")
         curses.curs_set(0)
+        # Make sure getch blocks in the kernel while idle; a polling getch
+        # would spin the main loop at full CPU.
+        self.screen.timeout(-1)
         init_colors()
+        # curses.color_pair crosses into C on every call; cache the values
+        # once colors are ready.
+        self.color_pairs = {pair: curses.color_pair(pair) for pair in ColorPair}
+        # Precombine the two attribute sets used by the status line so that
+        # setting a status is a single tuple store.
+        self._normal_status_attr = self.color_pairs[ColorPair.NORMAL] | A_ITALIC
+        self._error_status_attr = self.color_pairs[ColorPair.ERROR]
 
         # Setup windows and pads.
         self.dim = self.screen.getmaxyx()
+        self.update_dimensions()
         self.page_pad = PagePad(self.h - 2)
         self.status_line = self.screen.subwin(
             *self.line_dim,
@@ -210,131 +351,131 @@ class Browser:
             self.history.save()
 
     def handle_inputs(self):
-        char = self.screen.getch()
-        if char == ord("?"):
-            self.open_help()
-        elif char == ord(":"):
-            self.quick_command("")
-        elif char == ord("r"):
-            self.reload_page()
-        elif char == ord("h") or char == curses.KEY_LEFT:
-            self.scroll_page_horizontally(-self.config["scroll_step"])
-        elif char == ord("H"):
-            self.scroll_whole_page_left()
-        elif char == ord("j") or char == curses.KEY_DOWN:
-            self.scroll_page_vertically(self.config["scroll_step"])
-        elif char == ord("J") or char == curses.KEY_NPAGE:
-            self.scroll_whole_page_down()
-        elif char == ord("k") or char == curses.KEY_UP:
-            self.scroll_page_vertically(-self.config["scroll_step"])
-        elif char == ord("K") or char == curses.KEY_PPAGE:
-            self.scroll_whole_page_up()
-        elif char == ord("l") or char == curses.KEY_RIGHT:
-            self.scroll_page_horizontally(self.config["scroll_step"])
-        elif char == ord("L"):
-            self.scroll_whole_page_right()
-        elif char == ord("^"):
-            self.scroll_page_horizontally(-inf)
-        elif char == ord("g"):
-            char = self.screen.getch()
-            if char == ord("g"):
+        """Handle one key or event from the screen.
+
+        Most keys are dispatched through the keymap built in `setup_keymaps`;
+        the remaining branches cover events that need a follow-up read (the "g"
+        prefix, ESC) or carry extra data (digits, mouse, resize).
+        """
+        getch = self.screen.getch
+        char = getch()
+        scroll_delta = self.get_scroll_delta(char)
+        if scroll_delta:
+            self.handle_scroll_input(scroll_delta)
+            return
+        handler = self.keymap.get(char)
+        if handler:
+            handler()
+        elif char == KEY_G:
+            char = getch()
+            if char == KEY_G:
                 self.scroll_page_vertically(-inf)
-        elif char == ord("G"):
-            self.scroll_page_vertically(inf)
-        elif char == ord("o"):
-            self.quick_command("open")
-        elif char == ord("O"):
-            self.quick_command(f"open {self.current_url}")
-        elif char == ord("p"):
-            self.go_back()
-        elif char == ord("u"):
-            self.go_to_parent_page()
-        elif char == ord("U"):
-            self.go_to_root_page()
-        elif char == ord("b"):
-            self.open_bookmarks()
-        elif char == ord("B"):
-            self.add_bookmark()
-        elif char == ord("e"):
-            self.edit_page()
-        elif char == ord("y"):
-            self.open_history()
-        elif char == ord("m"):
-            self.toggle_render_mode()
-        elif char == ord("/"):
-            self.search_in_page()
-        elif char == ord("n"):
-            self.move_to_search_result(Browser.SEARCH_NEXT)
-        elif char == ord("N"):
-            self.move_to_search_result(Browser.SEARCH_PREVIOUS)
-        elif char == ord("i"):
-            self.show_page_info()
-        elif curses.ascii.isdigit(char):
+        elif KEY_ZERO <= char <= KEY_NINE:
             self.handle_digit_input(char)
-        elif char == curses.KEY_MOUSE:
+        elif char == KEY_MOUSE:
             try:
                 self.handle_mouse(*curses.getmouse())
             except curses.error:
                 logging.error("Failed to get mouse information.")
-        elif char == curses.KEY_RESIZE:
+        elif char == KEY_RESIZE:
             self.handle_resize()
-        elif char == curses.ascii.ESC:  # Can be ESC or ALT char.
+        elif char == KEY_ESC:  # Can be ESC or ALT char.
+            # The nodelay reset is in a finally clause: an exception must not
+            # leave the whole input loop in polling mode.
             self.screen.nodelay(True)
-            char = self.screen.getch()
-            self.screen.nodelay(False)
+            try:
+                char = getch()
+            finally:
+                self.screen.nodelay(False)
             if char == -1:
                 self.reset_status()
             else:  # ALT keybinds.
-                if char == ord("h"):
-                    self.scroll_page_horizontally(-1)
-                elif char == ord("j"):
-                    self.scroll_page_vertically(1)
-                elif char == ord("k"):
-                    self.scroll_page_vertically(-1)
-                elif char == ord("l"):
-                    self.scroll_page_horizontally(1)
-                elif char == ord("o"):
-                    self.open_last_download()
-
-    @property
-    def page_pad_size(self):
-        return self.h - 3, self.w - 1
-
-    @property
-    def status_line_pos(self):
-        return self.h - 2, 0
+                handler = self.alt_keymap.get(char)
+                if handler:
+                    handler()
 
-    @property
-    def command_line_pos(self):
-        return self.h - 1, 0
+    def get_scroll_delta(self, char):
+        """Return the (lines, columns) to scroll for this key, or None.
 
-    @property
-    def line_dim(self):
-        return 1, self.w
+        Step keys scroll by the configured scroll step, whole-page keys by the
+        page dimensions.
+        """
+        units = SCROLL_UNITS.get(char)
+        if units:
+            step = self._scroll_step
+            return units[0] * step, units[1] * step
+        units = PAGE_SCROLL_UNITS.get(char)
+        if units:
+            height, width = self.page_pad_size
+            return units[0] * height, units[1] * width
+        return None
+
+    def handle_scroll_input(self, scroll_delta):
+        """Scroll the page, coalescing all queued scroll keystrokes.
+
+        Key autorepeat or fast wheel emulation can queue many scroll events in
+        a single tick; summing them before scrolling does a single scroll and
+        page refresh per burst instead of one per key.
+        """
+        v_lines, h_columns = scroll_delta
+        getch = self.screen.getch
+        self.screen.nodelay(True)
+        try:
+            while True:
+                char = getch()
+                if char == -1:
+                    break
+                next_delta = self.get_scroll_delta(char)
+                if next_delta is None:
+                    # Not a scroll key: push it back for the next tick.
+                    curses.ungetch(char)
+                    break
+                v_lines += next_delta[0]
+                h_columns += next_delta[1]
+        finally:
+            self.screen.nodelay(False)
+        if v_lines:
+            self.scroll_page_vertically(v_lines)
+        if h_columns:
+            self.scroll_page_horizontally(h_columns)
 
     def refresh_windows(self):
-        """Refresh all windows and clear command line."""
-        self.refresh_page()
-        self.refresh_status_line()
+        """Refresh all windows and clear command line.
+
+        Windows updates are queued with noutrefresh; the final status line
+        refresh flushes them all in a single doupdate.
+        """
+        self.page_pad.refresh_content(*self.page_pad_size)
         self.command_line.clear()
+        # The screen may have been cleared or overwritten by other windows:
+        # force a redraw of the status line.
+        self._last_status_render = None
+        self.refresh_status_line()
 
     def refresh_page(self):
         """Refresh the current page pad; it does not reload the page."""
         self.page_pad.refresh_content(*self.page_pad_size)
+        curses.doupdate()
 
     def refresh_status_line(self):
-        """Refresh status line contents."""
-        text, pair, attributes = self.status_data
+        """Refresh status line contents, unless nothing changed."""
+        render = self.status_data + (self.w,)
+        if render == self._last_status_render:
+            return
+        self._last_status_render = render
+        text, attributes = self.status_data
         logging.debug("Status: " + text)
-        text = text[:self.w - 1]
-        color = curses.color_pair(pair)
-        self.status_line.addstr(0, 0, text, color | attributes)
+        # Only allocate a truncated copy when the text does not fit.
+        if len(text) >= self.w:
+            text = text[:self.w - 1]
+        self.status_line.addstr(0, 0, text, attributes)
         self.status_line.clrtoeol()
-        self.status_line.refresh()
+        self.status_line.noutrefresh()
+        curses.doupdate()
 
     def set_status(self, text):
         """Set a regular message in the status bar."""
-        self.status_data = text, ColorPair.NORMAL, A_ITALIC
+        self.status_data = text, self._normal_status_attr
         self.refresh_status_line()
 
     def reset_status(self):
@@ -343,7 +484,7 @@ class Browser:
 
     def set_status_error(self, text):
         """Set an error message in the status bar."""
-        self.status_data = text, ColorPair.ERROR, 0
+        self.status_data = text, self._error_status_attr
         self.refresh_status_line()
 
     def quick_command(self, command):
@@ -458,42 +599,19 @@ class Browser:
                 self.set_status_error(f"Can't open '{url}'.")
                 return
 
-        # Replace URL passed as parameter by a sanitized one.
-        url = unparse_url(parts)
+        # Replace URL passed as parameter by a sanitized one. Intern it as
+        # well: the same URL ends up as key in the history, the cache and the
+        # links maps, so sharing one str makes those hashes and comparisons
+        # cheaper.
+        url = sys.intern(unparse_url(parts))
 
         scheme = parts["scheme"]
-        if scheme == "gemini":
-            from bebop.browser.gemini import open_gemini_url
-            success = open_gemini_url(
-                self,
-                url,
-                redirects=redirects,
-                use_cache=use_cache
-            )
-            if history and success:
-                self.history.push(url)
-
-        elif scheme.startswith("http"):
-            from bebop.browser.web import open_web_url
-            open_web_url(self, url)
-
-        elif scheme == "file":
-            from bebop.browser.file import open_file
-            file_url = open_file(self, parts["path"])
-            if history and file_url:
-                self.history.push(file_url)
-
-        elif scheme == "bebop":
-            special_page = self.special_pages.get(parts["path"])
-            if special_page:
-                special_page["open"]()
-            else:
-                self.set_status_error("Unknown page.")
+        handler = self.scheme_handlers.get(scheme)
+        if handler:
+            handler(url, parts, redirects, history, use_cache)
 
         else:
-            from bebop.plugins import SchemePlugin
-            plugins = (p for p in self.plugins if isinstance(p, SchemePlugin))
-            plugin = next(filter(lambda p: p.scheme == scheme, plugins), None)
+            plugin = self._scheme_plugins.get(scheme)
             if plugin:
                 result_url = plugin.open_url(self, url)
                 if history and result_url:
@@ -501,13 +619,62 @@ class Browser:
             else:
                 self.set_status_error(f"Protocol '{scheme}' not supported.")
 
+    def open_gemini_scheme_url(self, url, parts, redirects, history, use_cache):
+        """Open a gemini URL; see `open_url` for the arguments."""
+        success = self._open_gemini_url(
+            self,
+            url,
+            redirects=redirects,
+            use_cache=use_cache
+        )
+        if history and success:
+            self.history.push(url)
+
+    def open_web_scheme_url(self, url, parts, redirects, history, use_cache):
+        """Open an HTTP(S) URL; see `open_url` for the arguments."""
+        self._open_web_url(self, url)
+
+    def open_file_scheme_url(self, url, parts, redirects, history, use_cache):
+        """Open a file URL; see `open_url` for the arguments."""
+        file_url = self._open_file(self, parts["path"])
+        if history and file_url:
+            self.history.push(file_url)
+
+    def open_bebop_scheme_url(self, url, parts, redirects, history, use_cache):
+        """Open an internal bebop URL; see `open_url` for the arguments."""
+        special_page = self.special_pages.get(parts["path"])
+        if special_page:
+            special_page["open"]()
+        else:
+            self.set_status_error("Unknown page.")
+
     def load_page(self, page: Page):
         """Set this page as the current page and refresh appropriate windows."""
+        if page is self.page_pad.current_page:
+            # This exact Page object is already rendered in the pad (e.g. a
+            # cache hit on the currently shown page): skip the re-render and
+            # just reset the view to the top.
+            self.page_pad.current_line = 0
+            self.page_pad.current_column = 0
+            self.refresh_page()
+            return
+        # Build the page info string once per load instead of on each request.
+        mime = page.mime.short if page.mime else "unk. MIME"
+        encoding = page.encoding or "unk. encoding"
+        self._page_info = (
+            f"{mime}  {encoding}  "
+            f"{len(page.source)} chars  {len(page.metalines)} lines"
+        )
         old_pad_height = self.page_pad.dim[0]
         self.page_pad.show_page(page)
         if self.page_pad.dim[0] < old_pad_height:
-            self.screen.clear()
-            self.screen.refresh()
+            # The new page is shorter: erase only the gap left between its end
+            # and the status line instead of wiping and repainting the whole
+            # screen.
+            for line in range(self.page_pad.dim[0], self.h - 2):
+                self.screen.move(line, 0)
+                self.screen.clrtoeol()
+            self.screen.noutrefresh()
             self.refresh_windows()
         else:
             self.refresh_page()
@@ -535,14 +702,53 @@ class Browser:
     def handle_mouse(self, mouse_id: int, x: int, y: int, z: int, bstate: int):
         """Handle mouse events.
 
-        Vertical scrolling is handled, and clicking on links.
+        Vertical scrolling is handled, and clicking on links. Wheel events
+        queued behind the current one are coalesced into a single scroll.
         """
         if bstate & ButtonState.SCROLL_UP:
-            self.scroll_page_vertically(-3)
+            delta = -3
         elif bstate & ButtonState.SCROLL_DOWN:
-            self.scroll_page_vertically(3)
-        elif bstate & ButtonState.LEFT_CLICKED:
-            self.handle_mouse_click(x, y)
+            delta = 3
+        else:
+            if bstate & ButtonState.LEFT_CLICKED:
+                self.handle_mouse_click(x, y)
+            return
+        delta += self.drain_mouse_scroll_events()
+        if delta:
+            self.scroll_page_vertically(delta)
+
+    def drain_mouse_scroll_events(self):
+        """Return the summed scroll delta of queued mouse wheel events.
+
+        Wheel ticks often arrive several at a time; draining them here lets
+        `handle_mouse` scroll and refresh the page only once per burst. The
+        first queued event that is not a wheel tick is pushed back.
+        """
+        delta = 0
+        getch = self.screen.getch
+        self.screen.nodelay(True)
+        try:
+            while True:
+                char = getch()
+                if char == -1:
+                    break
+                if char != curses.KEY_MOUSE:
+                    curses.ungetch(char)
+                    break
+                try:
+                    _, x, y, z, bstate = curses.getmouse()
+                except curses.error:
+                    break
+                if bstate & ButtonState.SCROLL_UP:
+                    delta -= 3
+                elif bstate & ButtonState.SCROLL_DOWN:
+                    delta += 3
+                else:
+                    curses.ungetmouse(0, x, y, z, bstate)
+                    break
+        finally:
+            self.screen.nodelay(False)
+        return delta
 
     def handle_mouse_click(self, x: int, y: int):
         """Handle a mouse click.
@@ -583,6 +789,8 @@ class Browser:
         # Avoid work if the resizing does not impact us.
         if self.dim == old_dim:
             return
+        self.update_dimensions()
+        self._last_status_render = None
         # Resize windows to fit the new dimensions. Content pad will be updated
         # on its own at the end of the function.
         self.status_line.resize(*self.line_dim)
@@ -593,10 +801,13 @@ class Browser:
         if self.command_line_pos[0] >= 0:
             self.command_line.window.mvwin(*self.command_line_pos)
         # If the content pad does not fit its whole place, we have to clean the
-        # gap between it and the status line. Refresh all screen.
+        # gap between it and the status line; erase those rows only and queue
+        # the update so refresh_windows flushes everything in one pass.
         if self.page_pad.dim[0] < self.h - 2:
-            self.screen.clear()
-            self.screen.refresh()
+            for line in range(self.page_pad.dim[0], self.h - 2):
+                self.screen.move(line, 0)
+                self.screen.clrtoeol()
+            self.screen.noutrefresh()
         self.refresh_windows()
 
     def scroll_page_vertically(self, by_lines):
@@ -606,6 +817,9 @@ class Browser:
         this amount of lines. If `by_lines` is one of the floats inf and -inf,
         go to the end of file and beginning of file, respectively.
         """
+        if by_lines == 0:
+            # Coalesced scroll inputs may cancel out to a no-op.
+            return
         window_height = self.h - 2
         require_refresh = False
         if by_lines == inf:
@@ -617,14 +831,6 @@ class Browser:
         if require_refresh:
             self.refresh_page()
 
-    def scroll_whole_page_down(self):
-        """Scroll down by a whole page."""
-        self.scroll_page_vertically(self.page_pad_size[0])
-
-    def scroll_whole_page_up(self):
-        """Scroll up by a whole page."""
-        self.scroll_page_vertically(-self.page_pad_size[0])
-
     def scroll_page_horizontally(self, by_columns):
         """Scroll page horizontally.
 
@@ -632,6 +838,8 @@ class Browser:
         this amount of columns. If `by_lines` is -inf, scroll back to the first
         column. Scrolling to the right-most column is not supported.
         """
+        if by_columns == 0:
+            return
         if by_columns == -inf:
             require_refresh = self.page_pad.go_to_first_column()
         else:
@@ -639,14 +847,6 @@ class Browser:
         if require_refresh:
             self.refresh_page()
 
-    def scroll_whole_page_left(self):
-        """Scroll left by a whole page."""
-        self.scroll_page_horizontally(-self.page_pad_size[1])
-
-    def scroll_whole_page_right(self):
-        """Scroll right by a whole page."""
-        self.scroll_page_horizontally(self.page_pad_size[1])
-
     def reload_page(self):
         """Reload the page, if one has been previously loaded."""
         if self.current_url:
@@ -664,16 +864,30 @@ class Browser:
     def go_to_parent_page(self):
         """Go to the parent URL if possible."""
         if self.current_url:
-            self.open_url(get_parent_url(self.current_url))
+            if self._parent_url is None:
+                self._parent_url = get_parent_url(self.current_url)
+            self.open_url(self._parent_url)
 
     def go_to_root_page(self):
         """Go to the root URL if possible."""
         if self.current_url:
-            self.open_url(get_root_url(self.current_url))
+            if self._root_url is None:
+                self._root_url = get_root_url(self.current_url)
+            self.open_url(self._root_url)
 
     def open_internal_page(self, name, gemtext):
-        """Open some content corresponding to a "bebop:" internal URL."""
-        page = Page.from_gemtext(gemtext, get_render_options(self.config))
+        """Open some content corresponding to a "bebop:" internal URL.
+
+        Rendered pages are cached keyed on their name, content and render
+        options, so re-opening an unchanged page (e.g. help) skips the
+        parsing and wrapping passes entirely.
+        """
+        options = get_render_options(self.config)
+        key = (name, hash(gemtext), options.width, options.mode, options.bullet)
+        page = self._internal_page_cache.get(key)
+        if page is None:
+            page = Page.from_gemtext(gemtext, options)
+            self._internal_page_cache.put(key, page)
         self.load_page(page)
         self.current_url = "bebop:" + name
 
@@ -708,8 +922,9 @@ class Browser:
         directly from their location on disk.
         """
         delete_source_after = False
-        parts = parse_url(self.current_url)
-        if parts["scheme"] == "bebop":
+        memfd = None
+        parts = self._current_parts
+        if parts.get("scheme") == "bebop":
             page_name = parts["path"]
             special_pages_functions = self.special_pages.get(page_name)
             if not special_pages_functions:
@@ -719,20 +934,36 @@ class Browser:
         else:
             if not self.current_page:
                 return
-            source = self.current_page.source
-            with tempfile.NamedTemporaryFile("wt", delete=False) as source_file:
-                source_file.write(source)
-                source_filename = source_file.name
-            delete_source_after = True
+            page = self.current_page
+            # Encode the source once and write it in binary mode: this skips
+            # the incremental text encoding and newline translation layers.
+            source = page.source.encode(page.encoding or "utf-8")
+            if hasattr(os, "memfd_create"):  # Linux, Python 3.8+.
+                # The source already lives in memory: hand it to the editor
+                # through an in-kernel anonymous file instead of a disk
+                # round-trip. The procfs path below resolves to our open fd
+                # from any process.
+                memfd = os.memfd_create("bebop-source")
+                os.write(memfd, source)
+                source_filename = f"/proc/{os.getpid()}/fd/{memfd}"
+            else:
+                with tempfile.NamedTemporaryFile(
+                    "wb", delete=False
+                ) as source_file:
+                    source_file.write(source)
+                    source_filename = source_file.name
+                delete_source_after = True
 
         if not source_filename:
             return
 
-        command = self.config["source_editor"] + [source_filename]
+        command = self._source_editor + [source_filename]
         success = open_external_program(command)
         if not success:
             self.set_status_error("Could not open editor.")
 
+        if memfd is not None:
+            os.close(memfd)
         if delete_source_after:
             os.unlink(source_filename)
         self.refresh_windows()
@@ -743,7 +974,8 @@ class Browser:
 
     def prompt(self, text: str, keys: str ="yn"):
         """Display the text and allow it to type one of the given keys."""
-        choice = "/".join(keys)
+        # Most prompts are yes/no: reuse the prepared suffix for them.
+        choice = "y/n" if keys == "yn" else "/".join(keys)
         self.set_status(f"{text} [{choice}]")
         return self.command_line.prompt_key(keys)
 
@@ -757,18 +989,50 @@ class Browser:
             return
         mime_type, path = self.last_download
         main_type = mime_type.main_type if mime_type else ""
-        command = self.config["external_commands"].get(main_type)
+        command = self._external_commands.get(main_type)
         if not command:
-            command = self.config["external_command_default"]
+            command = self._external_command_default
+        # Resolve the executable path once per command; passing it to Popen
+        # with close_fds disabled skips a PATH walk and a scan of open file
+        # descriptors before exec.
+        executable = self._resolved_executables.get(command[0])
+        if executable is None:
+            executable = shutil.which(command[0]) or command[0]
+            self._resolved_executables[command[0]] = executable
         command = command + [str(path)]
         self.set_status(f"Running '{' '.join(command)}'...")
         try:
-            subprocess.Popen(
-                command,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True
-            )
+            if self._use_posix_spawn:
+                # posix_spawn execs directly instead of forking the whole
+                # interpreter address space first; the viewer's output goes
+                # to the void as with the Popen variant below.
+                try:
+                    os.posix_spawn(
+                        executable,
+                        command,
+                        os.environ,
+                        file_actions=[
+                            (os.POSIX_SPAWN_OPEN, 1,
+                             os.devnull, os.O_WRONLY, 0),
+                            (os.POSIX_SPAWN_OPEN, 2,
+                             os.devnull, os.O_WRONLY, 0),
+                        ],
+                        setsid=True,
+                    )
+                except NotImplementedError:
+                    # setsid support is checked at runtime and can be missing
+                    # even where posix_spawn itself exists (e.g. old macOS);
+                    # stick to Popen from now on.
+                    self._use_posix_spawn = False
+            if not self._use_posix_spawn:
+                subprocess.Popen(
+                    command,
+                    executable=executable,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False,
+                    start_new_session=True
+                )
         except FileNotFoundError as exc:
             self.set_status_error(f"Failed to run command: {exc}")
 
@@ -782,15 +1046,9 @@ class Browser:
 
     def show_page_info(self):
         """Show some page informations in the status bar."""
-        page = self.current_page
-        if not page:
+        if self.current_page is None or self._page_info is None:
             return
-        mime = page.mime.short if page.mime else "unk. MIME"
-        encoding = page.encoding or "unk. encoding"
-        size = f"{len(page.source)} chars"
-        lines = f"{len(page.metalines)} lines"
-        info = f"{mime}  {encoding}  {size}  {lines}"
-        self.set_status(info)
+        self.set_status(self._page_info)
 
     def set_render_mode(self, mode):
         """Set the render mode for the current path or capsule."""
@@ -824,7 +1082,9 @@ class Browser:
         else:
             cur_mod_index = RENDER_MODES.index(current_mode)
             next_mode = RENDER_MODES[(cur_mod_index + 1) % len(RENDER_MODES)]
-        render_opts.mode = next_mode
+        # Use a copy of the options: the current ones may be shared with a
+        # cached rendering of the page.
+        render_opts = replace(render_opts, mode=next_mode)
         new_page = Page.from_gemtext(page.source, render_opts)
         self.load_page(new_page)
         self.set_status(f"Using render mode '{next_mode}'.")
@@ -890,3 +1150,12 @@ class Browser:
                 continue
 
             logging.info(f"Loaded plugin {plugin_name}.")
+
+        # Register scheme plugins once, so open_url does not have to import
+        # the plugins module and scan the plugin list on every navigation.
+        from bebop.plugins import SchemePlugin
+        self._scheme_plugins = {
+            plugin.scheme: plugin
+            for plugin in self.plugins
+            if isinstance(plugin, SchemePlugin)
+        }
@@ -1,6 +1,7 @@
 """Local files browser."""
 
 import logging
+import mmap
 from pathlib import Path
 from urllib.parse import quote, unquote
 
@@ -29,9 +30,17 @@ def open_file(browser: Browser, filepath: str, encoding="utf-8"):
         return None
 
     if path.is_file():
+        # Map the file instead of reading it into an intermediate buffer, to
+        # avoid the extra copy for big files; empty files can't be mapped.
         try:
-            with open(path, "rt", encoding=encoding) as f:
-                text = f.read()
+            with open(path, "rb") as f:
+                try:
+                    with mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mm:
+                        text = mm.read().decode(encoding)
+                except ValueError:
+                    text = f.read().decode(encoding)
         except (OSError, ValueError) as exc:
             browser.set_status_error(f"Failed to open file: {exc}")
             return None
@@ -71,10 +71,12 @@ def open_gemini_url(
         if identity:
             cert_and_key = get_cert_and_key(identity["id"])
 
-    if use_cache and url in browser.cache:
-        browser.load_page(browser.cache[url])
-        browser.current_url = url
-        return url
+    if use_cache:
+        page = browser.cache.get(url)
+        if page is not None:
+            browser.load_page(page)
+            browser.current_url = url
+            return url
 
     logging.info(
         f"Request {url}"
@@ -250,7 +252,7 @@ def _handle_successful_response(
     if page:
         browser.load_page(page)
         browser.current_url = url
-        browser.cache[url] = page
+        browser.cache.put(url, page)
         return url
     elif filepath:
         try:
@@ -36,9 +36,9 @@ class CommandLine:
         self.textbox = Textbox(self.window, insert_mode=True)
 
     def clear(self):
-        """Clear command-line contents."""
+        """Clear command-line contents; the refresh is only queued."""
         self.window.clear()
-        self.window.refresh()
+        self.window.noutrefresh()
 
     def gather(self) -> str:
         """Return the string currently written by the user in command line.
@@ -12,6 +12,7 @@ DEFAULT_CONFIG = {
     "source_editor": ["vi"],
     "command_editor": ["vi"],
     "history_limit": 1000,
+    "cache_limit": 64,
     "external_commands": {},
     "external_command_default": ["xdg-open"],
     "home": "bebop:welcome",
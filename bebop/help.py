@@ -63,6 +63,7 @@ Bebop uses a JSON file (usually in ~/.config). It is created with default values
 
 Here are the available options:
 
+* cache_limit (int): maximum number of pages kept in the memory cache.
 * command_editor (see note 1): command to use for editing cli input.
 * connect_timeout (int): seconds before connection times out.
 * download_path (string): download path.
@@ -15,6 +15,16 @@ class History:
 
     def push(self, url):
         """Add an URL to the history."""
+        # Same URL pushed twice in a row (e.g. the same link followed again):
+        # it is already at the top of both lists, skip the linear removal
+        # scan. Checking the backlist too matters: going back pops it, so its
+        # top can lag behind urls[-1] and must then be pushed again.
+        if (
+            self.urls and self.urls[-1] == url
+            and self.backlist and self.backlist[-1] == url
+        ):
+            return
+
         # Append url to our URLs, bubbling it up if it's already there.
         try:
             self.urls.remove(url)
@@ -24,10 +34,14 @@ class History:
         if len(self.urls) > self.limit:
             self.urls.pop(0)
 
-        # Also simply push it to the backlist.
-        self.backlist.append(url)
-        if len(self.backlist) > self.limit:
-            self.backlist.pop(0)
+        # Also simply push it to the backlist, unless it is already its last
+        # entry (e.g. the same link has been followed twice in a row): going
+        # back should not take several presses to leave the page, and the
+        # backlist should not grow with redundant entries.
+        if not self.backlist or self.backlist[-1] != url:
+            self.backlist.append(url)
+            if len(self.backlist) > self.limit:
+                self.backlist.pop(0)
 
     def get_previous(self, actual_previous=False):
         """Return previous URL, or None if there is only one or zero URL."""
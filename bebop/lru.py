@@ -0,0 +1,37 @@
+"""Small LRU cache for pages."""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded key/value cache, evicting least recently used entries.
+
+    Attributes:
+    - maxsize: maximum number of entries kept in the cache.
+    - entries: ordered dict of cached values, from least to most recently
+      used.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """Return the cached value for this key, or None.
+
+        A hit marks the entry as most recently used.
+        """
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Cache this value, evicting the least recently used one if needed."""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
@@ -20,9 +20,11 @@ keys:
 - link_id: only alongside "url" key, ID generated for this link.
 """
 
-import string
+import re
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import lru_cache
+from itertools import chain
 from typing import List
 
 from bebop.gemtext import (
@@ -30,8 +32,12 @@ from bebop.gemtext import (
 
 
 SPLIT_CHARS = " \t-"
+SPLIT_CHARS_RE = re.compile("[" + SPLIT_CHARS + "]")
 JOIN_CHAR = "-"
 
+#: Indent strings shared between wrap calls, filled lazily per indent width.
+_INDENT_CACHE = {}
+
 
 class LineType(IntEnum):
     """Type of line.
@@ -53,6 +59,14 @@ class LineType(IntEnum):
 
 RENDER_MODES = ("fancy", "dumb")
 
+#: LineType members used in the formatter loops, bound at module level;
+#: reading them through the enum class goes through a descriptor each time.
+_PARAGRAPH = LineType.PARAGRAPH
+_LINK = LineType.LINK
+_PREFORMATTED = LineType.PREFORMATTED
+_BLOCKQUOTE = LineType.BLOCKQUOTE
+_LIST_ITEM = LineType.LIST_ITEM
+
 
 @dataclass
 class RenderOptions:
@@ -69,68 +83,78 @@ def generate_metalines(elements: list, options: RenderOptions) -> list:
     - elements: list of elements to use.
     - options: RenderOptions to respect when generating metalines.
     """
-    metalines = []
-    separator = (LineType.NONE, "", None)
+    if options.mode == "dumb":
+        return _generate_metalines_dumb(elements, options)
+    return _generate_metalines_fancy(elements, options)
+
+
+def _generate_metalines_dumb(elements: list, options: RenderOptions) -> list:
+    """Dumb-mode worker for `generate_metalines`: no margins nor separators."""
+    chunks = []
+    for element in elements:
+        entry = _FORMATTERS.get(type(element))
+        if entry is None:
+            continue
+        element_metalines = entry[0](element, options)
+        # Elements producing no metalines still need to be rendered as empty
+        # lines.
+        if not element_metalines:
+            element_metalines = [(_PARAGRAPH, "", None)]
+        chunks.append(element_metalines)
+    return list(chain.from_iterable(chunks))
+
+
+def _generate_metalines_fancy(elements: list, options: RenderOptions) -> list:
+    """Fancy-mode worker for `generate_metalines`, with margin separators."""
+    # Collect per-element line lists and flatten them once at the end: a
+    # single allocation instead of growing one list element by element.
+    chunks = []
+    separator_chunk = [(LineType.NONE, "", None)]
     has_margins = False
     thin_type = None
     for index, element in enumerate(elements):
         previous_had_margins = has_margins
         last_thin_type = thin_type
-        has_margins = False
-        thin_type = None
-        if isinstance(element, Title):
-            element_metalines = format_title(element, options)
-            has_margins = True
-        elif isinstance(element, Paragraph):
-            element_metalines = format_paragraph(element, options)
-            has_margins = True
-        elif isinstance(element, Link):
-            element_metalines = format_link(element, options)
-            thin_type = LineType.LINK
-        elif isinstance(element, Preformatted):
-            element_metalines = format_preformatted(element, options)
-            has_margins = True
-        elif isinstance(element, Blockquote):
-            element_metalines = format_blockquote(element, options)
-            has_margins = True
-        elif isinstance(element, ListItem):
-            element_metalines = format_list_item(element, options)
-            thin_type = LineType.LIST_ITEM
-        else:
+        entry = _FORMATTERS.get(type(element))
+        if entry is None:
+            has_margins = False
+            thin_type = None
             continue
-        # In dumb mode, elements producing no metalines still need to be
-        # rendered as empty lines.
-        if options.mode == "dumb":
-            if not element_metalines:
-                element_metalines = [(LineType.PARAGRAPH, "", None)]
+        formatter, has_margins, thin_type = entry
+        element_metalines = formatter(element, options)
         # If current element requires margins and is not the first elements,
         # separate from previous element. Also do it if the current element does
         # not require margins but follows an element that required it (e.g. link
         # after a paragraph). Also do it if both the current and previous
         # elements do not require margins but differ in type.
-        elif (
+        if (
             (has_margins and index > 0)
             or (not has_margins and previous_had_margins)
             or (not has_margins and thin_type != last_thin_type)
         ):
-            metalines.append(separator)
+            chunks.append(separator_chunk)
         # Append the element metalines now.
-        metalines += element_metalines
-    return metalines
+        chunks.append(element_metalines)
+    return list(chain.from_iterable(chunks))
 
 
 def generate_dumb_metalines(lines):
     """Generate dumb metalines: all lines are given the PARAGRAPH line type."""
-    return [(LineType.PARAGRAPH, line, None) for line in lines]
+    return [(_PARAGRAPH, line, None) for line in lines]
 
 
 def format_title(title: Title, options: RenderOptions):
     """Return metalines for this title."""
     width = options.width
     if title.level == 1:
-        wrapped = wrap_words(title.text, width)
-        line_template = f"{{:^{width}}}"
-        lines = (line_template.format(line) for line in wrapped)
+        # Center the lines with explicit padding: a "{:^n}" format spec would
+        # re-parse the format mini-language for every line. As with the format
+        # spec, an odd padding leaves the extra space on the right.
+        lines = []
+        for line in wrap_words(title.text, width):
+            left_pad = (width - len(line)) // 2
+            right_pad = width - len(line) - left_pad
+            lines.append(" " * left_pad + line + " " * right_pad)
     else:
         if title.level == 2:
             lines = wrap_words(title.text, width, indent=2)
@@ -143,7 +167,7 @@ def format_title(title: Title, options: RenderOptions):
 def format_paragraph(paragraph: Paragraph, options: RenderOptions):
     """Return metalines for this paragraph."""
     lines = wrap_words(paragraph.text, options.width)
-    return [(LineType.PARAGRAPH, line, None) for line in lines]
+    return [(_PARAGRAPH, line, None) for line in lines]
 
 
 def format_link(link: Link, options: RenderOptions):
@@ -159,20 +183,20 @@ def format_link(link: Link, options: RenderOptions):
     }
     # Replace first line indentation with the anchor.
     first_line_text = link_anchor + lines[0][len(link_anchor):]
-    first_line = [(LineType.LINK, first_line_text, first_line_extra)]
-    other_lines = [(LineType.LINK, line, None) for line in lines[1:]]
+    first_line = [(_LINK, first_line_text, first_line_extra)]
+    other_lines = [(_LINK, line, None) for line in lines[1:]]
     return first_line + other_lines  # type: ignore
 
 
 def format_preformatted(preformatted: Preformatted, options: RenderOptions):
     """Return metalines for this preformatted block."""
-    return [(LineType.PREFORMATTED, line, None) for line in preformatted.lines]
+    return [(_PREFORMATTED, line, None) for line in preformatted.lines]
 
 
 def format_blockquote(blockquote: Blockquote, options: RenderOptions):
     """Return metalines for this blockquote."""
     lines = wrap_words(blockquote.text, options.width, indent=2)
-    return [(LineType.BLOCKQUOTE, line, None) for line in lines]
+    return [(_BLOCKQUOTE, line, None) for line in lines]
 
 
 def format_list_item(item: ListItem, options: RenderOptions):
@@ -181,63 +205,88 @@ def format_list_item(item: ListItem, options: RenderOptions):
     lines = wrap_words(item.text, options.width, indent=indent)
     first_line = options.bullet + lines[0][indent:]
     lines[0] = first_line
-    return [(LineType.LIST_ITEM, line, None) for line in lines]
+    return [(_LIST_ITEM, line, None) for line in lines]
+
+
+#: Formatter function, margin requirement and "thin type" for each element
+#: class, keyed on the element type: `generate_metalines` dispatches in one
+#: dict lookup instead of an isinstance chain per element.
+_FORMATTERS = {
+    Title: (format_title, True, None),
+    Paragraph: (format_paragraph, True, None),
+    Link: (format_link, False, LineType.LINK),
+    Preformatted: (format_preformatted, True, None),
+    Blockquote: (format_blockquote, True, None),
+    ListItem: (format_list_item, False, LineType.LIST_ITEM),
+}
 
 
 def wrap_words(text: str, width: int, indent: int =0) -> List[str]:
-    """Wrap a text in several lines according to the renderer's width."""
+    """Wrap a text in several lines according to the renderer's width.
+
+    The result is memoized, so a fresh list is returned to keep callers free
+    to modify it; the wrapped lines themselves are shared.
+    """
+    return list(_wrap_words(text, width, indent))
+
+
+@lru_cache(maxsize=4096)
+def _wrap_words(text: str, width: int, indent: int):
+    """Memoized worker for `wrap_words`, returning a tuple of lines."""
     lines = []
-    line = " " * indent
-    words = _explode_words(text)
-    for word in words:
-        line_len, word_len = len(line), len(word)
+    pad = _INDENT_CACHE.get(indent)
+    if pad is None:
+        pad = _INDENT_CACHE[indent] = " " * indent
+    # Accumulate each line as a list of parts with a running length, joined
+    # only when the line is flushed; repeated str concatenation would copy
+    # the whole line on every word.
+    parts = [pad]
+    line_len = indent
+    for word in _explode_words(text):
+        word_len = len(word)
         # If adding the new word would overflow the line, use a new line.
         if line_len + word_len > width:
             # Push only non-empty lines.
             if line_len > 0:
-                lines.append(line)
-                line = " " * indent
+                lines.append("".join(parts))
+                parts = [pad]
+                line_len = indent
             # Force split words that are longer than the width.
             while word_len > width:
                 split_offset = width - 1 - indent
-                word_line = " " * indent + word[:split_offset] + JOIN_CHAR
-                lines.append(word_line)
+                lines.append(pad + word[:split_offset] + JOIN_CHAR)
                 word = word[split_offset:]
                 word_len = len(word)
             word = word.lstrip()
-        line += word
-    if line:
-        lines.append(line)
-    return lines
+            word_len = len(word)
+        parts.append(word)
+        line_len += word_len
+    if line_len > 0:
+        lines.append("".join(parts))
+    return tuple(lines)
 
 
 def _explode_words(text: str) -> List[str]:
-    """Split a string into a list of words."""
+    """Split a string into a list of words, keeping the separators."""
+    # Most text contains neither hyphens nor tabs: the only separator is then
+    # the space char, so a plain str.split interleaved with spaces gives the
+    # same tokens as the regex scan below, entirely in C.
+    if "-" not in text and "\t" not in text:
+        split_words = text.split(" ")
+        words = [" "] * (2 * len(split_words) - 1)
+        words[0::2] = split_words
+        return words
     words = []
-    pos = 0
-    while True:
-        sep, sep_index = _find_next_sep(text[pos:])
-        if not sep:
-            words.append(text[pos:])
-            return words
-        word = text[pos : pos + sep_index]
+    last = 0
+    for match in SPLIT_CHARS_RE.finditer(text):
+        word = text[last:match.start()]
+        sep = match.group()
         # If the separator is not a space char, append it to the word.
-        if sep in string.whitespace:
+        if sep == JOIN_CHAR:
+            words.append(word + sep)
+        else:
             words.append(word)
             words.append(sep)
-        else:
-            words.append(word + sep)
-        pos += sep_index + 1
-
-
-def _find_next_sep(text: str):
-    """Find the next separator index and return both the separator and index."""
-    indices = []
-    for sep in SPLIT_CHARS:
-        try:
-            indices.append((sep, text.index(sep)))
-        except ValueError:
-            pass
-    if not indices:
-        return ("", 0)
-    return min(indices, key=lambda e: e[1])
+        last = match.end()
+    words.append(text[last:])
+    return words
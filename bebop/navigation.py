@@ -6,6 +6,7 @@ turned into a basic re-implementation of the RFC.
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from urllib.parse import quote
 
@@ -51,6 +52,18 @@ def parse_url(url: str, default_scheme: Optional[str] =None) -> Dict[str, Any]:
     Raises:
     InvalidUrlException if you put really really stupid strings in there.
     """
+    # Return a copy as callers may modify the parts they get.
+    return dict(_parse_url(url, default_scheme))
+
+
+@lru_cache(maxsize=256)
+def _parse_url(url: str, default_scheme: Optional[str]) -> Dict[str, Any]:
+    """Do the actual parsing for `parse_url`, memoized.
+
+    URLs are parsed again and again during navigation (reloads, redirections,
+    going back through history); the LRU cache avoids running the regex more
+    than once per URL.
+    """
     match = URI_RE.match(url)
     if not match:
         raise InvalidUrlException(url)
@@ -29,15 +29,30 @@ class PagePad:
         self.current_column = 0
 
     def refresh_content(self, x, y):
-        """Refresh content pad's view using the current line/column."""
+        """Refresh content pad's view using the current line/column.
+
+        The refresh is only queued with noutrefresh: the caller is responsible
+        for flushing it with `curses.doupdate`, possibly batched with other
+        windows updates.
+        """
         if x <= 0 or y <= 0:
             return
         content_position = self.current_line, self.current_column
         try:
-            self.pad.refresh(*content_position, 0, 0, x, y)
+            self.pad.noutrefresh(*content_position, 0, 0, x, y)
         except curses.error:
             pass
 
+    @staticmethod
+    def _scroll_axis(current: int, delta: int, max_value: int):
+        """Clamp current + delta into the [0, max_value] range.
+
+        Returns:
+        Tuple of the new value and whether it differs from the current one.
+        """
+        new_value = max(0, min(current + delta, max(0, max_value)))
+        return new_value, new_value != current
+
     def scroll_v(self, num_lines: int, window_height: int =0):
         """Make the content pad scroll up and down by num_lines.
 
@@ -48,18 +63,9 @@ class PagePad:
         Returns:
         True if scrolling occured and the pad has to be refreshed.
         """
-        if num_lines < 0:
-            num_lines = -num_lines
-            min_line = 0
-            if self.current_line > min_line:
-                self.current_line = max(self.current_line - num_lines, min_line)
-                return True
-        else:
-            max_line = self.dim[0] - window_height
-            if self.current_line < max_line:
-                self.current_line = min(self.current_line + num_lines, max_line)
-                return True
-        return False
+        self.current_line, changed = self._scroll_axis(
+            self.current_line, num_lines, self.dim[0] - window_height)
+        return changed
 
     def scroll_h(self, num_columns: int, window_width: int =0):
         """Make the content pad scroll left and right by num_columns.
@@ -72,20 +78,9 @@ class PagePad:
         Returns:
         True if scrolling occured and the pad has to be refreshed.
         """
-        if num_columns < 0:
-            num_columns = -num_columns
-            min_column = 0
-            if self.current_column > min_column:
-                new_column = self.current_column - num_columns
-                self.current_column = max(new_column, min_column)
-                return True
-        else:
-            max_column = self.dim[1] - window_width
-            if self.current_column < max_column:
-                new_column = self.current_column + num_columns
-                self.current_column = min(new_column, max_column)
-                return True
-        return False
+        self.current_column, changed = self._scroll_axis(
+            self.current_column, num_columns, self.dim[1] - window_width)
+        return changed
 
     def go_to_beginning(self):
         """Make the pad show its start; return True if a refresh is needed."""
@@ -0,0 +1,80 @@
+import unittest
+
+from ..gemtext import (
+    Blockquote, Link, ListItem, Paragraph, Preformatted, Title, parse_gemtext)
+
+
+class TestGemtext(unittest.TestCase):
+
+    def test_parse_gemtext(self):
+        text = "\n".join((
+            "# Level 1 title",
+            "## Level 2 title",
+            "Some text.",
+            "=> gemini://example.com/1 First link",
+            "=> gemini://example.com/2",
+            "> A quote.",
+            "* An item.",
+        ))
+        elements, links, title = parse_gemtext(text)
+        self.assertListEqual(
+            elements,
+            [
+                Title(1, "Level 1 title"),
+                Title(2, "Level 2 title"),
+                Paragraph("Some text."),
+                Link("gemini://example.com/1", "First link", 1),
+                Link("gemini://example.com/2", None, 2),
+                Blockquote("A quote."),
+                ListItem("An item."),
+            ]
+        )
+        self.assertEqual(links[1], "gemini://example.com/1")
+        self.assertEqual(links[2], "gemini://example.com/2")
+        self.assertEqual(title, "Level 1 title")
+
+    def test_parse_gemtext_invalid_markup(self):
+        # Markup chars not followed by the expected separator are paragraphs.
+        text = "\n".join((
+            "#nospace",
+            "*nospace",
+        ))
+        elements, _, _ = parse_gemtext(text)
+        self.assertListEqual(
+            elements,
+            [Paragraph("#nospace"), Paragraph("*nospace")]
+        )
+
+    def test_parse_gemtext_preformatted(self):
+        text = "\n".join((
+            "```",
+            "# Not a title",
+            "=> not-a-link",
+            "```",
+            "```",
+            "unclosed block",
+        ))
+        elements, links, _ = parse_gemtext(text)
+        self.assertListEqual(
+            elements,
+            [
+                Preformatted(["# Not a title", "=> not-a-link"]),
+                Preformatted(["unclosed block"]),
+            ]
+        )
+        self.assertEqual(len(links), 0)
+
+    def test_parse_gemtext_empty_lines(self):
+        text = "First.\n\nSecond."
+        # Standard mode discards empty lines.
+        elements, _, _ = parse_gemtext(text)
+        self.assertListEqual(
+            elements,
+            [Paragraph("First."), Paragraph("Second.")]
+        )
+        # Dumb mode keeps them.
+        elements, _, _ = parse_gemtext(text, dumb=True)
+        self.assertListEqual(
+            elements,
+            [Paragraph("First."), Paragraph(""), Paragraph("Second.")]
+        )
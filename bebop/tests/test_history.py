@@ -0,0 +1,76 @@
+import unittest
+
+from ..history import History
+
+
+class TestHistory(unittest.TestCase):
+
+    def test_push(self):
+        history = History(3)
+        history.push("gemini://example.com/1")
+        history.push("gemini://example.com/2")
+        self.assertListEqual(
+            history.urls,
+            ["gemini://example.com/1", "gemini://example.com/2"]
+        )
+        # Pushing an URL again bubbles it up instead of duplicating it.
+        history.push("gemini://example.com/1")
+        self.assertListEqual(
+            history.urls,
+            ["gemini://example.com/2", "gemini://example.com/1"]
+        )
+        # The oldest URL is dropped when the limit is exceeded.
+        history.push("gemini://example.com/3")
+        history.push("gemini://example.com/4")
+        self.assertListEqual(
+            history.urls,
+            [
+                "gemini://example.com/1",
+                "gemini://example.com/3",
+                "gemini://example.com/4",
+            ]
+        )
+
+    def test_push_deduplicates_backlist(self):
+        history = History(10)
+        history.push("gemini://example.com/1")
+        history.push("gemini://example.com/1")
+        history.push("gemini://example.com/2")
+        history.push("gemini://example.com/2")
+        self.assertListEqual(
+            history.backlist,
+            ["gemini://example.com/1", "gemini://example.com/2"]
+        )
+        # Consecutive identical pushes do not duplicate URLs either.
+        self.assertListEqual(
+            history.urls,
+            ["gemini://example.com/1", "gemini://example.com/2"]
+        )
+
+    def test_push_after_get_previous(self):
+        history = History(10)
+        history.push("gemini://example.com/1")
+        history.push("gemini://example.com/2")
+        self.assertEqual(history.get_previous(), "gemini://example.com/1")
+        # Revisiting the page we just left must push it on the backlist again,
+        # even though it is still the most recent entry of the URL list.
+        history.push("gemini://example.com/2")
+        history.push("gemini://example.com/3")
+        self.assertListEqual(
+            history.backlist,
+            [
+                "gemini://example.com/1",
+                "gemini://example.com/2",
+                "gemini://example.com/3",
+            ]
+        )
+        self.assertEqual(history.get_previous(), "gemini://example.com/2")
+
+    def test_get_previous(self):
+        history = History(10)
+        self.assertIsNone(history.get_previous())
+        history.push("gemini://example.com/1")
+        history.push("gemini://example.com/2")
+        self.assertEqual(history.get_previous(), "gemini://example.com/1")
+        # The backlist is never completely emptied.
+        self.assertEqual(history.get_previous(), "gemini://example.com/1")
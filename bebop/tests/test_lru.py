@@ -0,0 +1,36 @@
+import unittest
+
+from ..lru import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_put_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_get_refreshes_entry(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        # Using "a" makes "b" the eviction candidate.
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+
+    def test_put_refreshes_entry(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        # Overwriting "a" makes "b" the eviction candidate.
+        cache.put("a", 10)
+        cache.put("c", 3)
+        self.assertEqual(cache.get("a"), 10)
+        self.assertIsNone(cache.get("b"))
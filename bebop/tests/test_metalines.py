@@ -1,6 +1,6 @@
 import unittest
 
-from ..metalines import _explode_words, _find_next_sep, wrap_words
+from ..metalines import _explode_words, wrap_words
 
 
 class TestMetalines(unittest.TestCase):
@@ -29,13 +29,11 @@ class TestMetalines(unittest.TestCase):
         ]
         self.assertListEqual(words, expected)
 
-    def test_find_next_sep(self):
-        t = "unsplittableword word-dash"
-        sep, index = _find_next_sep(t)
-        self.assertEqual((sep, index), (" ", 16))
-        t = t[17:]
-        sep, index = _find_next_sep(t)
-        self.assertEqual((sep, index), ("-", 4))
-        t = t[5:]
-        sep, index = _find_next_sep(t)
-        self.assertEqual((sep, index), ("", 0))
+    def test_explode_words_consecutive_seps(self):
+        words = _explode_words("two  spaces-")
+        self.assertListEqual(words, ["two", " ", "", " ", "spaces-", ""])
+
+    def test_explode_words_spaces_only(self):
+        words = _explode_words("plain words  here ")
+        expected = ["plain", " ", "words", " ", "", " ", "here", " ", ""]
+        self.assertListEqual(words, expected)